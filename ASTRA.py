@@ -16,20 +16,18 @@ Purpose:
     - Backtests or simulations
 """
 
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 import streamlit as st
 import pandas as pd
 
 from data.loader import download_data, clean_data
 from risk.metrics import (
-    calculate_returns,
-    calculate_volatility,
-    calculate_drawdown,
     find_major_drawdowns,
     calculate_recovery,
     calculate_risk_metrics,
 )
+from risk._pipeline import compute_risk_columns
 from analysis.indicators import calculate_factors
 from analysis.backtest import run_ma_crossover_strategy
 from analysis.monte_carlo import run_monte_carlo_simulation
@@ -44,13 +42,18 @@ from ui.components import (
 )
 
 
-def _load_and_prepare_data(ticker: str) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+def _load_and_prepare_data(
+    ticker: str, columns: Optional[List[str]] = None
+) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
     """
     Load and preprocess data for a given ticker.
 
     Contract:
     - Input:
         - ticker: Stock or index ticker symbol.
+        - columns: Optional column subset forwarded to the price cache;
+          unrequested price columns come back as NA. Cache misses always
+          download and clean the full frame.
     - Output:
         - (df, error_message)
         - df: Cleaned DataFrame with all required columns if success, else None.
@@ -60,7 +63,7 @@ def _load_and_prepare_data(ticker: str) -> Tuple[Optional[pd.DataFrame], Optiona
     - Side effects:
         - None.
     """
-    raw_data, err = download_data(ticker=ticker)
+    raw_data, err = download_data(ticker=ticker, columns=columns)
     if err:
         return None, err
 
@@ -71,6 +74,153 @@ def _load_and_prepare_data(ticker: str) -> Tuple[Optional[pd.DataFrame], Optiona
     return cleaned, None
 
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def _run_pipeline(ticker: str) -> Tuple[Optional[dict], Optional[str]]:
+    """
+    Run the full risk pipeline for a ticker, cached across Streamlit reruns.
+
+    Contract:
+    - Input:
+        - ticker: Stock or index ticker symbol (the only cache key).
+    - Output:
+        - (result, error_message)
+        - result: Dict with df, drawdowns_df, recovery_df, risk_metrics if
+          success, else None.
+        - error_message: None on success, or error description on failure.
+    - Errors:
+        - Returns (None, message) if any pipeline stage fails.
+    - Side effects:
+        - First call per ticker downloads data; repeats are cache hits.
+    """
+    # Every consumer of the pipeline frame reads Date and Close only
+    # (Date travels as the Parquet index), so cache hits skip
+    # deserializing the rest of OHLCV from disk.
+    df, err = _load_and_prepare_data(ticker=ticker, columns=["Close"])
+    if err or df is None:
+        return None, err or "Unknown error loading data."
+
+    # Returns, volatility, and drawdown in one fused pass over Close.
+    df, err = compute_risk_columns(df)
+    if err or df is None:
+        return None, f"Error calculating risk columns: {err}"
+
+    drawdowns_df, err = find_major_drawdowns(df=df, threshold=20.0)
+    if err:
+        return None, f"Error finding drawdowns: {err}"
+    if drawdowns_df is None:
+        drawdowns_df = pd.DataFrame()
+
+    recovery_df = calculate_recovery(df=df, drawdowns_df=drawdowns_df)
+
+    risk_metrics, err = calculate_risk_metrics(df=df, ticker=ticker)
+    if err or risk_metrics is None:
+        return None, f"Error calculating risk metrics: {err}"
+
+    df, err = calculate_factors(df=df)
+    if err or df is None:
+        return None, f"Error calculating indicators: {err}"
+
+    return (
+        {
+            "df": df,
+            "drawdowns_df": drawdowns_df,
+            "recovery_df": recovery_df,
+            "risk_metrics": risk_metrics,
+        },
+        None,
+    )
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _run_strategy_cached(
+    ticker: str, short_window: int = 20, long_window: int = 100
+) -> Tuple[Optional[pd.DataFrame], Optional[dict], Optional[str]]:
+    """
+    Cached MA-crossover backtest keyed by (ticker, short_window, long_window).
+
+    Contract:
+    - Input:
+        - ticker: Ticker whose cached pipeline data to use.
+        - short_window / long_window: MA lengths.
+    - Output:
+        - Same tuple as analysis.backtest.run_ma_crossover_strategy.
+    - Errors:
+        - Returns (None, None, message) if the pipeline or strategy fails.
+    - Side effects:
+        - None beyond the pipeline cache.
+    """
+    result, err = _run_pipeline(ticker=ticker)
+    if err or result is None:
+        return None, None, err
+    return run_ma_crossover_strategy(result["df"], short_window, long_window)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _run_monte_carlo_cached(
+    ticker: str, horizon_days: int = 126, n_sims: int = 500
+) -> Tuple[Optional[pd.DataFrame], Optional[float], Optional[str]]:
+    """
+    Cached Monte Carlo simulation keyed by (ticker, horizon_days, n_sims).
+
+    Contract:
+    - Input:
+        - ticker: Ticker whose cached pipeline data to use.
+        - horizon_days / n_sims: Simulation parameters.
+    - Output:
+        - Same tuple as analysis.monte_carlo.run_monte_carlo_simulation.
+    - Errors:
+        - Returns (None, None, message) if the pipeline or simulation fails.
+    - Side effects:
+        - None beyond the pipeline cache.
+    """
+    result, err = _run_pipeline(ticker=ticker)
+    if err or result is None:
+        return None, None, err
+    return run_monte_carlo_simulation(result["df"], horizon_days, n_sims)
+
+
+@st.fragment
+def _risk_dashboard_tab(df: pd.DataFrame, ticker: str, recovery_df: pd.DataFrame) -> None:
+    """Fragment: risk dashboard tab; reruns in isolation on interaction."""
+    render_risk_dashboard(df=df, ticker=ticker, recovery_df=recovery_df)
+
+
+@st.fragment
+def _metrics_tab(risk_metrics: dict) -> None:
+    """Fragment: key metrics tab; reruns in isolation on interaction."""
+    render_key_metrics(risk_metrics=risk_metrics)
+
+
+@st.fragment
+def _drawdowns_tab(drawdowns_df: pd.DataFrame) -> None:
+    """Fragment: drawdowns tab; reruns in isolation on interaction."""
+    render_drawdowns_table(drawdowns_df=drawdowns_df)
+
+
+@st.fragment
+def _recovery_tab(recovery_df: pd.DataFrame) -> None:
+    """Fragment: recovery tab; reruns in isolation on interaction."""
+    render_recovery_table(recovery_df=recovery_df)
+
+
+@st.fragment
+def _data_tab(df: pd.DataFrame, ticker: str) -> None:
+    """Fragment: data summary tab; reruns in isolation on interaction."""
+    render_data_summary(df=df, ticker=ticker)
+
+
+@st.fragment
+def _strategy_tab(df: pd.DataFrame, ticker: str) -> None:
+    """Fragment: strategy tab; widget changes rerun only this block."""
+    render_strategy_view(df=df, ticker=ticker, run_strategy=_run_strategy_cached)
+
+
+@st.fragment
+def _monte_carlo_tab(df: pd.DataFrame, ticker: str) -> None:
+    """Fragment: Monte Carlo tab; widget changes rerun only this block."""
+    render_monte_carlo_view(df=df, ticker=ticker, run_simulation=_run_monte_carlo_cached)
+
+
 def main() -> None:
     """
     Main Streamlit application entry point.
@@ -102,46 +252,16 @@ def main() -> None:
         st.info("Enter a ticker and click **Run Analysis** to start.")
         return
 
-    df, err = _load_and_prepare_data(ticker=ticker)
-    if err or df is None:
+    # Core risk pipeline (cached per ticker; reruns are cache hits)
+    result, err = _run_pipeline(ticker=ticker)
+    if err or result is None:
         st.error(f"❌ Error: {err or 'Unknown error loading data.'}")
         return
 
-    # Core risk pipeline
-    df, err = calculate_returns(df)
-    if err or df is None:
-        st.error(f"❌ Error calculating returns: {err}")
-        return
-
-    df, err = calculate_volatility(df)
-    if err or df is None:
-        st.error(f"❌ Error calculating volatility: {err}")
-        return
-
-    df, err = calculate_drawdown(df)
-    if err or df is None:
-        st.error(f"❌ Error calculating drawdown: {err}")
-        return
-
-    drawdowns_df, err = find_major_drawdowns(df=df, threshold=20.0)
-    if err:
-        st.error(f"❌ Error finding drawdowns: {err}")
-        return
-    if drawdowns_df is None:
-        drawdowns_df = pd.DataFrame()
-
-    recovery_df = calculate_recovery(df=df, drawdowns_df=drawdowns_df)
-
-    risk_metrics, err = calculate_risk_metrics(df=df, ticker=ticker)
-    if err or risk_metrics is None:
-        st.error(f"❌ Error calculating risk metrics: {err}")
-        return
-
-    # Phase A indicators
-    df, err = calculate_factors(df=df)
-    if err or df is None:
-        st.error(f"❌ Error calculating indicators: {err}")
-        return
+    df = result["df"]
+    drawdowns_df = result["drawdowns_df"]
+    recovery_df = result["recovery_df"]
+    risk_metrics = result["risk_metrics"]
 
     tabs = st.tabs(
         [
@@ -155,26 +275,28 @@ def main() -> None:
         ]
     )
 
+    # Each tab is an st.fragment, so interacting with one tab reruns only
+    # that block instead of the whole script (the pipeline stays cached).
     with tabs[0]:
-        render_risk_dashboard(df=df, ticker=ticker, recovery_df=recovery_df)
+        _risk_dashboard_tab(df=df, ticker=ticker, recovery_df=recovery_df)
 
     with tabs[1]:
-        render_key_metrics(risk_metrics=risk_metrics)
+        _metrics_tab(risk_metrics=risk_metrics)
 
     with tabs[2]:
-        render_drawdowns_table(drawdowns_df=drawdowns_df)
+        _drawdowns_tab(drawdowns_df=drawdowns_df)
 
     with tabs[3]:
-        render_recovery_table(recovery_df=recovery_df)
+        _recovery_tab(recovery_df=recovery_df)
 
     with tabs[4]:
-        render_data_summary(df=df, ticker=ticker)
+        _data_tab(df=df, ticker=ticker)
 
     with tabs[5]:
-        render_strategy_view(df=df, ticker=ticker, run_strategy=run_ma_crossover_strategy)
+        _strategy_tab(df=df, ticker=ticker)
 
     with tabs[6]:
-        render_monte_carlo_view(df=df, ticker=ticker, run_simulation=run_monte_carlo_simulation)
+        _monte_carlo_tab(df=df, ticker=ticker)
 
 
 if __name__ == "__main__":
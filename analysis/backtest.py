@@ -11,8 +11,11 @@ Responsibilities:
 
 from typing import Dict, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+from risk._kernels import rolling_mean
+
 
 def run_ma_crossover_strategy(
     df: pd.DataFrame,
@@ -40,20 +43,28 @@ def run_ma_crossover_strategy(
     if "Date" not in df.columns or "Close" not in df.columns or "Daily_Return" not in df.columns:
         return None, None, "DataFrame must contain Date, Close, and Daily_Return columns."
 
-    prices = df.set_index("Date")["Close"]
-    short_ma = prices.rolling(short_window).mean()
-    long_ma = prices.rolling(long_window).mean()
+    # Work on raw arrays: no per-column set_index("Date") reconstruction,
+    # MAs via the shared Numba rolling kernel.
+    close = df["Close"].to_numpy(dtype=np.float64)
+    returns = df["Daily_Return"].to_numpy(dtype=np.float64)
+
+    short_ma = rolling_mean(close, short_window)
+    long_ma = rolling_mean(close, long_window)
+    signal = short_ma > long_ma  # NaN comparisons are False, as in pandas
+
+    # Yesterday's signal applied to today's return; day 0 is flat.
+    strategy_returns = np.zeros_like(returns)
+    strategy_returns[1:] = np.where(signal[:-1], returns[1:], 0.0)
 
-    signal = (short_ma > long_ma).astype(int)
-    strategy_returns = signal.shift(1).fillna(0) * df.set_index("Date")["Daily_Return"]
-    strategy_equity = (1 + strategy_returns).cumprod()
-    buy_hold_equity = prices / prices.iloc[0]
+    strategy_equity = np.cumprod(1.0 + strategy_returns)
+    buy_hold_equity = close / close[0]
 
     equity_df = pd.DataFrame(
         {
             "Strategy_Equity": strategy_equity,
             "BuyHold_Equity": buy_hold_equity,
-        }
+        },
+        index=pd.Index(df["Date"], name="Date"),
     ).dropna()
 
     stats: Dict[str, float] = {}  # Placeholder for Phase B
@@ -11,8 +11,11 @@ Responsibilities:
 
 from typing import List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+from risk._kernels import pct_change, rolling_mean
+
 
 def calculate_factors(df: pd.DataFrame, ma_windows: Optional[List[int]] = None) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
     """
@@ -29,18 +32,16 @@ def calculate_factors(df: pd.DataFrame, ma_windows: Optional[List[int]] = None)
     - Errors:
         - Returns (None, message) if Close missing.
     - Side effects:
-        - None (returns modified copy).
+        - None (input is not mutated; the result shares unmodified columns).
     """
     if "Close" not in df.columns:
         return None, "DataFrame must contain 'Close' column."
 
-    result = df.copy()
     if ma_windows is None:
         ma_windows = [20, 100]
 
-    for w in ma_windows:
-        result[f"MA_{w}"] = result["Close"].rolling(window=w).mean()
-
-    result["Mom_20d"] = result["Close"].pct_change(20) * 100.0
-    return result, None
+    close = df["Close"].to_numpy(dtype=np.float64)
+    new_cols = {f"MA_{w}": rolling_mean(close, w) for w in ma_windows}
+    new_cols["Mom_20d"] = pct_change(close, 20) * 100.0
+    return df.assign(**new_cols), None
 
@@ -14,11 +14,14 @@ from typing import Optional, Tuple
 import numpy as np
 import pandas as pd
 
+from analysis._kernels import _simulate_paths
+
 
 def run_monte_carlo_simulation(
     df: pd.DataFrame,
     horizon_days: int = 126,
     n_sims: int = 500,
+    seed: Optional[int] = None,
 ) -> Tuple[Optional[pd.DataFrame], Optional[float], Optional[str]]:
     """
     Run a basic Monte Carlo price path simulation using historical returns.
@@ -28,15 +31,29 @@ def run_monte_carlo_simulation(
         - df: DataFrame with Daily_Return and Close.
         - horizon_days: Number of future trading days to simulate.
         - n_sims: Number of simulation paths.
+        - seed: Optional RNG seed for reproducible paths.
     - Output:
         - (sim_paths_df, var_5_loss_pct, error_message)
-        - sim_paths_df: DataFrame of shape [horizon_days, n_sims] if success, else None.
+        - sim_paths_df: DataFrame of downsampled paths for plotting
+          (every 10th step, at most 200 paths) if success, else None.
+          VaR is computed from the terminal prices of ALL n_sims paths.
         - var_5_loss_pct: 5% worst-case loss in % relative to last price if success, else None.
         - error_message: None on success, error description on failure.
     - Errors:
         - Returns (None, None, message) if required columns missing or invalid params.
     - Side effects:
         - None.
+
+    Notes:
+        GBM parameters are estimated from log returns, log(1 + r), not
+        arithmetic returns — the kernel's update is s *= exp(mu + sigma*z),
+        so feeding it arithmetic-return moments would bias the drift.
+        Paths are generated by a Numba kernel (analysis._kernels
+        ._simulate_paths) parallelized with prange across simulations: each
+        path fuses the shock draw, exp, and running product into one loop
+        with the price held in a register, storing only the downsampled
+        plot matrix and the terminal prices. Path j is seeded with
+        seed + j, so results are reproducible for a given seed.
     """
     if "Daily_Return" not in df.columns or "Close" not in df.columns:
         return None, None, "DataFrame must contain Daily_Return and Close columns."
@@ -44,18 +61,40 @@ def run_monte_carlo_simulation(
     if horizon_days <= 0 or n_sims <= 0:
         return None, None, "horizon_days and n_sims must be positive integers."
 
-    mu = df["Daily_Return"].mean()
-    sigma = df["Daily_Return"].std()
+    returns = df["Daily_Return"].to_numpy(dtype=np.float64)
+    returns = returns[~np.isnan(returns)]
+    if returns.size < 2:
+        return None, None, "Not enough return observations to estimate parameters."
+
+    log_returns = np.log1p(returns)
+    mu_log = float(log_returns.mean())
+    sigma_log = float(log_returns.std(ddof=1))
     last_price = float(df["Close"].iloc[-1])
 
-    shocks = np.random.normal(mu, sigma, size=(horizon_days, n_sims))
-    log_returns = shocks  # Using shocks as daily log-returns approximation
-    price_paths = last_price * np.exp(np.cumsum(log_returns, axis=0))
+    if seed is None:
+        seed = int(np.random.default_rng().integers(0, 2**31 - 1))
 
-    sim_paths_df = pd.DataFrame(price_paths)
-    final_prices = sim_paths_df.iloc[-1]
-    var_5_price = np.percentile(final_prices, 5)
+    plot_stride = 10 if horizon_days >= 10 else 1
+    n_plot = min(n_sims, 200)
+
+    plot_paths, final_prices = _simulate_paths(
+        mu_log,
+        sigma_log,
+        last_price,
+        int(horizon_days),
+        int(n_sims),
+        int(seed),
+        plot_stride,
+        n_plot,
+    )
+
+    # O(N) selection of the 5th-percentile outcome instead of a full sort:
+    # the k-th smallest final price is the 5% worst case.
+    k = max(1, int(0.05 * n_sims))
+    var_5_price = float(np.partition(final_prices, k - 1)[k - 1])
     var_5_loss_pct = (last_price - var_5_price) / last_price * 100.0
 
+    sim_paths_df = pd.DataFrame(plot_paths)
+
     return sim_paths_df, float(var_5_loss_pct), None
 
@@ -0,0 +1,148 @@
+"""
+Module: data/_cache.py
+
+Purpose:
+    Persistent on-disk cache for downloaded price data.
+
+Responsibilities:
+    - Store/retrieve DataFrames as Parquet files keyed by request parameters
+    - Track fetch timestamps in a sidecar JSON and enforce a TTL
+    - Fail soft: any cache problem must fall back to a fresh download
+
+No dependencies on other ASTRA modules.
+"""
+
+import json
+import re
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import pandas as pd
+
+
+class FileCache:
+    """
+    File-backed DataFrame cache keyed by request parameters.
+
+    Contract:
+    - Input:
+        - cache_dir: Directory for cached Parquet files (created on demand).
+        - ttl_days: Age in days after which an entry is considered stale.
+    - Output:
+        - load() returns a DataFrame on a fresh hit, else None.
+        - store() persists a DataFrame, silently ignoring failures.
+    - Errors:
+        - Never raises from load()/store(); cache errors degrade to misses.
+    - Side effects:
+        - Reads/writes files under cache_dir.
+    """
+
+    def __init__(self, cache_dir: str = ".cache/prices", ttl_days: float = 1.0) -> None:
+        """
+        Configure the cache location and entry lifetime.
+
+        Contract:
+        - Input:
+            - cache_dir: Directory for cached Parquet files.
+            - ttl_days: Age in days after which entries go stale.
+        - Output:
+            - None.
+        - Errors:
+            - None (the directory is only created on first store()).
+        - Side effects:
+            - None.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_days * 86400.0
+
+    @staticmethod
+    def make_key(ticker: str, start: Optional[str], interval: str) -> str:
+        """
+        Build a filesystem-safe cache key from request parameters.
+
+        Contract:
+        - Input:
+            - ticker: Symbol as passed to the downloader.
+            - start: Start date string, or None for full history.
+            - interval: Bar interval (e.g. "1d").
+        - Output:
+            - Key string safe to use as a filename stem.
+        - Errors:
+            - None.
+        - Side effects:
+            - None.
+        """
+        raw = f"{ticker}_{start or 'max'}_{interval}"
+        return re.sub(r"[^A-Za-z0-9._-]", "-", raw)
+
+    def _data_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.parquet"
+
+    def _meta_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def load(self, key: str, columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+        """
+        Return the cached DataFrame for key if present and fresh, else None.
+
+        Contract:
+        - Input:
+            - key: Key from make_key().
+            - columns: Optional column subset; Parquet is columnar, so only
+              the requested columns are read from disk. If the stored
+              schema does not match (e.g. MultiIndex columns from the
+              downloader), the full frame is returned instead — a subset
+              request degrades to a full read, never to a miss.
+        - Output:
+            - DataFrame on fresh hit, None on miss/stale/corrupt entry.
+        - Errors:
+            - None (all cache errors are treated as misses).
+        - Side effects:
+            - Reads from cache_dir.
+        """
+        try:
+            meta_path = self._meta_path(key)
+            data_path = self._data_path(key)
+            if not meta_path.exists() or not data_path.exists():
+                return None
+
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+
+            if time.time() - float(meta.get("fetched_at", 0.0)) > self.ttl_seconds:
+                return None
+
+            if columns is not None:
+                try:
+                    return pd.read_parquet(data_path, columns=columns)
+                except Exception:
+                    # Schema mismatch: fall through to the full read rather
+                    # than reporting a miss and triggering a re-download.
+                    pass
+            return pd.read_parquet(data_path)
+        except Exception:
+            return None
+
+    def store(self, key: str, df: pd.DataFrame) -> None:
+        """
+        Persist a DataFrame under key (best effort).
+
+        Contract:
+        - Input:
+            - key: Key from make_key().
+            - df: DataFrame to cache.
+        - Output:
+            - None.
+        - Errors:
+            - None (failures are swallowed; cache is an optimization only).
+        - Side effects:
+            - Writes Parquet + sidecar JSON under cache_dir.
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(self._data_path(key), compression="zstd")
+            with open(self._meta_path(key), "w", encoding="utf-8") as f:
+                json.dump({"fetched_at": time.time()}, f)
+        except Exception:
+            pass
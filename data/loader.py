@@ -12,13 +12,23 @@ Responsibilities:
 No dependencies on other ASTRA modules.
 """
 
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
 
+from data._cache import FileCache
 
-def download_data(ticker: str, start_date: Optional[str] = None) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+
+_price_cache = FileCache(cache_dir=".cache/prices", ttl_days=1.0)
+
+
+def download_data(
+    ticker: str,
+    start_date: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
     """
     Download historical data for a given ticker.
 
@@ -26,15 +36,27 @@ def download_data(ticker: str, start_date: Optional[str] = None) -> Tuple[Option
     - Input:
         - ticker: Symbol to download.
         - start_date: Optional start date (YYYY-MM-DD).
+        - columns: Optional column subset for cache hits. Parquet is
+          columnar, so hot-path callers that only consume e.g. Close can
+          skip reading the rest of OHLCV from disk (the Date index is
+          always restored, so it need not be requested). Cache misses
+          always download and return the full frame.
     - Output:
         - (df, error_message)
-        - df: DataFrame with raw OHLCV data if success, else None.
+        - df: DataFrame with raw OHLCV data (or the requested subset on a
+          cache hit) if success, else None.
         - error_message: None on success, error description on failure.
     - Errors:
         - Returns (None, message) on download failure or empty data.
     - Side effects:
-        - Network call to Yahoo Finance via yfinance.
+        - Network call to Yahoo Finance via yfinance on cache miss.
+        - Reads/writes the on-disk price cache (.cache/prices).
     """
+    cache_key = FileCache.make_key(ticker=ticker, start=start_date, interval="1d")
+    cached = _price_cache.load(cache_key, columns=columns)
+    if cached is not None and not cached.empty:
+        return cached, None
+
     try:
         if start_date:
             data = yf.download(ticker, start=start_date, interval="1d", progress=False, auto_adjust=True)
@@ -46,6 +68,7 @@ def download_data(ticker: str, start_date: Optional[str] = None) -> Tuple[Option
     if data is None or data.empty:
         return None, f"No data returned for ticker: {ticker}"
 
+    _price_cache.store(cache_key, data)
     return data, None
 
 
@@ -59,6 +82,9 @@ def clean_data(raw_data: pd.DataFrame) -> Tuple[Optional[pd.DataFrame], Optional
     - Output:
         - (df, error_message)
         - df: Cleaned DataFrame with Date, Open, High, Low, Close, Volume.
+          Price columns are stored as float32 (plenty of precision for
+          display and risk math, half the memory traffic of float64);
+          Volume keeps its integer dtype.
         - error_message: None on success, error description on failure.
     - Errors:
         - Returns (None, message) if required fields are missing.
@@ -89,5 +115,10 @@ def clean_data(raw_data: pd.DataFrame) -> Tuple[Optional[pd.DataFrame], Optional
     df = df[["Date", "Open", "High", "Low", "Close", "Volume"]].copy()
     df = df.dropna(subset=["Date", "Close"]).sort_values("Date").reset_index(drop=True)
 
+    # Downcast price columns to float32: downstream rolling/drawdown passes
+    # are memory-bound, and ~7 significant digits is ample for prices.
+    for col in ("Open", "High", "Low", "Close"):
+        df[col] = pd.to_numeric(df[col], errors="coerce").astype(np.float32)
+
     return df, None
 
@@ -12,11 +12,13 @@ from risk.metrics import (
     calculate_recovery,
     calculate_risk_metrics,
 )
+from risk._pipeline import compute_risk_columns
 
 __all__ = [
     "calculate_returns",
     "calculate_volatility",
     "calculate_drawdown",
+    "compute_risk_columns",
     "find_major_drawdowns",
     "calculate_recovery",
     "calculate_risk_metrics",
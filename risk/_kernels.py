@@ -0,0 +1,255 @@
+"""
+Module: risk/_kernels.py
+
+Purpose:
+    Numba-compiled numeric kernels for the risk pipeline.
+
+Responsibilities:
+    - Pure array-in / array-out computation, no pandas and no I/O
+    - Keep the hot loops free of Python-interpreter dispatch
+
+Kernels are compiled lazily on first call and cached to disk
+(`cache=True`), and the module warms the cache at import time with a
+small dummy call so the first real request does not pay the JIT cost.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def _scan_drawdowns(
+    close: np.ndarray, threshold: float
+) -> tuple:
+    """
+    Single-pass drawdown episode scan.
+
+    Contract:
+    - Input:
+        - close: float64 array of closing prices, length >= 1.
+        - threshold: Minimum drawdown magnitude (%) to record.
+    - Output:
+        - (peak_idx, trough_idx, pct): parallel int64/int64/float64 arrays,
+          one entry per completed episode whose loss meets the threshold.
+    - Errors:
+        - None (pure numeric).
+    - Side effects:
+        - None.
+
+    An episode starts at a running-max peak, is tracked once price falls
+    below 95% of that peak, and completes when price makes a new high.
+    Episodes still open at the end of the series are not reported.
+    """
+    n = close.size
+    cap = n // 2 + 1
+    peak_out = np.empty(cap, np.int64)
+    trough_out = np.empty(cap, np.int64)
+    pct_out = np.empty(cap, np.float64)
+    count = 0
+
+    peak_idx = 0
+    peak_price = close[0]
+    in_dd = False
+    dd_peak_idx = 0
+    trough_idx = 0
+    trough_price = close[0]
+
+    for i in range(1, n):
+        price = close[i]
+
+        if price > peak_price:
+            if in_dd:
+                pct = (trough_price - close[dd_peak_idx]) / close[dd_peak_idx] * 100.0
+                if abs(pct) >= threshold:
+                    peak_out[count] = dd_peak_idx
+                    trough_out[count] = trough_idx
+                    pct_out[count] = pct
+                    count += 1
+            in_dd = False
+            peak_idx = i
+            peak_price = price
+
+        elif not in_dd:
+            if price < peak_price * 0.95:
+                # Bars between the peak and here were all >= 95% of the
+                # peak, so this bar is the lowest seen so far this episode.
+                in_dd = True
+                dd_peak_idx = peak_idx
+                trough_idx = i
+                trough_price = price
+
+        elif price < trough_price:
+            trough_idx = i
+            trough_price = price
+
+    return peak_out[:count], trough_out[:count], pct_out[:count]
+
+
+@njit(cache=True)
+def pct_change(x: np.ndarray, periods: int = 1) -> np.ndarray:
+    """
+    Fractional change between each element and the one `periods` back.
+
+    Contract:
+    - Input:
+        - x: float64 array of values.
+        - periods: Lookback distance (default 1).
+    - Output:
+        - float64 array, NaN for the first `periods` elements.
+    - Errors:
+        - None (pure numeric).
+    - Side effects:
+        - None.
+    """
+    n = x.size
+    out = np.empty(n, np.float64)
+    for i in range(min(periods, n)):
+        out[i] = np.nan
+    for i in range(periods, n):
+        out[i] = (x[i] - x[i - periods]) / x[i - periods]
+    return out
+
+
+@njit(cache=True)
+def rolling_mean(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    Rolling mean with pandas semantics (full windows only, NaN poisons).
+
+    Contract:
+    - Input:
+        - x: float64 array of values (may contain NaN).
+        - window: Window length.
+    - Output:
+        - float64 array; NaN before the first full window and for any
+          window containing NaN.
+    - Errors:
+        - None (pure numeric).
+    - Side effects:
+        - None.
+    """
+    n = x.size
+    out = np.full(n, np.nan)
+    s = 0.0
+    nan_count = 0
+    for i in range(n):
+        v = x[i]
+        if np.isnan(v):
+            nan_count += 1
+        else:
+            s += v
+        if i >= window:
+            old = x[i - window]
+            if np.isnan(old):
+                nan_count -= 1
+            else:
+                s -= old
+        if i >= window - 1 and nan_count == 0:
+            out[i] = s / window
+    return out
+
+
+@njit(cache=True)
+def rolling_std(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    Rolling sample standard deviation (ddof=1) with pandas semantics.
+
+    Contract:
+    - Input:
+        - x: float64 array of values (may contain NaN).
+        - window: Window length (>= 2 for a defined std).
+    - Output:
+        - float64 array; NaN before the first full window and for any
+          window containing NaN.
+    - Errors:
+        - None (pure numeric).
+    - Side effects:
+        - None.
+
+    Uses O(N) running sum / sum-of-squares updates instead of recomputing
+    each window from scratch.
+    """
+    n = x.size
+    out = np.full(n, np.nan)
+    s = 0.0
+    sq = 0.0
+    nan_count = 0
+    for i in range(n):
+        v = x[i]
+        if np.isnan(v):
+            nan_count += 1
+        else:
+            s += v
+            sq += v * v
+        if i >= window:
+            old = x[i - window]
+            if np.isnan(old):
+                nan_count -= 1
+            else:
+                s -= old
+                sq -= old * old
+        if i >= window - 1 and nan_count == 0:
+            var = (sq - s * s / window) / (window - 1)
+            if var < 0.0:
+                var = 0.0
+            out[i] = np.sqrt(var)
+    return out
+
+
+@njit(cache=True)
+def rolling_std_multi(x: np.ndarray, windows: np.ndarray) -> np.ndarray:
+    """
+    Rolling sample stds for several windows in a single pass.
+
+    Contract:
+    - Input:
+        - x: float64 array of values (may contain NaN).
+        - windows: int64 array of window lengths.
+    - Output:
+        - float64 array of shape (len(x), len(windows)), column k holding
+          the rolling std for windows[k] with the same semantics as
+          rolling_std.
+    - Errors:
+        - None (pure numeric).
+    - Side effects:
+        - None.
+
+    One sweep over x maintains a running sum / sum-of-squares pair per
+    window, so K windows cost one read of the input instead of K.
+    """
+    n = x.size
+    k = windows.size
+    out = np.full((n, k), np.nan)
+    sums = np.zeros(k, np.float64)
+    sqs = np.zeros(k, np.float64)
+    nan_counts = np.zeros(k, np.int64)
+    for i in range(n):
+        v = x[i]
+        v_is_nan = np.isnan(v)
+        for j in range(k):
+            w = windows[j]
+            if v_is_nan:
+                nan_counts[j] += 1
+            else:
+                sums[j] += v
+                sqs[j] += v * v
+            if i >= w:
+                old = x[i - w]
+                if np.isnan(old):
+                    nan_counts[j] -= 1
+                else:
+                    sums[j] -= old
+                    sqs[j] -= old * old
+            if i >= w - 1 and nan_counts[j] == 0:
+                var = (sqs[j] - sums[j] * sums[j] / w) / (w - 1)
+                if var < 0.0:
+                    var = 0.0
+                out[i, j] = np.sqrt(var)
+    return out
+
+
+# Warm the JIT cache so import cost is paid once, not on the first request.
+_scan_drawdowns(np.ones(16, dtype=np.float64), 20.0)
+pct_change(np.ones(16, dtype=np.float64))
+rolling_mean(np.ones(16, dtype=np.float64), 4)
+rolling_std(np.ones(16, dtype=np.float64), 4)
+rolling_std_multi(np.ones(16, dtype=np.float64), np.array([4, 8], dtype=np.int64))
@@ -15,8 +15,8 @@ from typing import Dict, Optional, Tuple
 
 import numpy as np
 import pandas as pd
-import ffn
-import quantstats as qs
+
+from risk._kernels import _scan_drawdowns, pct_change, rolling_std_multi
 
 
 RISK_FREE_RATE: float = 0.025
@@ -37,14 +37,12 @@ def calculate_returns(df: pd.DataFrame) -> Tuple[Optional[pd.DataFrame], Optiona
     - Errors:
         - Returns (None, message) if Close column is missing.
     - Side effects:
-        - None (returns modified copy).
+        - None (input is not mutated; the result shares unmodified columns).
     """
     if "Close" not in df.columns:
         return None, "DataFrame must contain 'Close' column."
 
-    result = df.copy()
-    result["Daily_Return"] = result["Close"].pct_change()
-    return result, None
+    return df.assign(Daily_Return=pct_change(df["Close"].to_numpy(dtype=np.float64))), None
 
 
 def calculate_volatility(df: pd.DataFrame) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
@@ -61,23 +59,22 @@ def calculate_volatility(df: pd.DataFrame) -> Tuple[Optional[pd.DataFrame], Opti
     - Errors:
         - Returns (None, message) if Daily_Return is missing.
     - Side effects:
-        - None (returns modified copy).
+        - None (input is not mutated; the result shares unmodified columns).
     """
     if "Daily_Return" not in df.columns:
         return None, "DataFrame must contain 'Daily_Return' column."
 
-    result = df.copy()
-    for window in (30, 60, TRADING_DAYS_PER_YEAR):
-        rolling_std = result["Daily_Return"].rolling(window=window).std()
-        annualized_vol = rolling_std * np.sqrt(TRADING_DAYS_PER_YEAR) * 100.0
-        result[f"Volatility_{window}d"] = annualized_vol
-
-    return result, None
+    returns = df["Daily_Return"].to_numpy(dtype=np.float64)
+    windows = np.array([30, 60, TRADING_DAYS_PER_YEAR], dtype=np.int64)
+    # All windows share one sweep over the returns array.
+    vols = rolling_std_multi(returns, windows) * (np.sqrt(TRADING_DAYS_PER_YEAR) * 100.0)
+    vol_cols = {f"Volatility_{window}d": vols[:, j] for j, window in enumerate(windows)}
+    return df.assign(**vol_cols), None
 
 
 def calculate_drawdown(df: pd.DataFrame) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
     """
-    Calculate drawdown series using ffn.
+    Calculate drawdown series.
 
     Contract:
     - Input:
@@ -89,56 +86,23 @@ def calculate_drawdown(df: pd.DataFrame) -> Tuple[Optional[pd.DataFrame], Option
     - Errors:
         - Returns (None, message) if required columns are missing.
     - Side effects:
-        - None.
+        - None (input is not mutated; the result shares unmodified columns).
     """
     if "Date" not in df.columns or "Close" not in df.columns:
         return None, "DataFrame must contain Date and Close columns."
 
-    result = df.copy()
-    prices = pd.Series(result["Close"].values, index=result["Date"])
-    dd_series = ffn.to_drawdown_series(prices)
-
-    result["Drawdown"] = dd_series.values * 100.0
-    result["Running_Max"] = result["Close"].expanding().max()
-    result["Max_Drawdown"] = result["Drawdown"].expanding().min()
-    return result, None
-
-
-def _calculate_drawdown_metrics(
-    df: pd.DataFrame, drawdown_start_idx: int, end_idx: int, threshold: float
-) -> Optional[Dict]:
-    """
-    Calculate metrics for a single drawdown period.
+    close = df["Close"].to_numpy(dtype=np.float64)
+    peaks = np.maximum.accumulate(close)
+    drawdown = (close / peaks - 1.0) * 100.0
 
-    Contract:
-    - Input:
-        - df: DataFrame with Date, Close columns.
-        - drawdown_start_idx: Index where drawdown started.
-        - end_idx: Index where drawdown ended (new peak reached).
-        - threshold: Minimum drawdown threshold (%).
-    - Output:
-        - Dictionary with drawdown metrics if threshold met, else None.
-    - Errors:
-        - Returns None if drawdown doesn't meet threshold.
-    - Side effects:
-        - None.
-    """
-    window = df.loc[drawdown_start_idx:end_idx]
-    trough_idx = window["Close"].idxmin()
-    trough_price = df.loc[trough_idx, "Close"]
-    dd_pct = (trough_price - df.loc[drawdown_start_idx, "Close"]) / df.loc[drawdown_start_idx, "Close"] * 100.0
-
-    if abs(dd_pct) < threshold:
-        return None
-
-    return {
-        "Peak_Date": df.loc[drawdown_start_idx, "Date"],
-        "Trough_Date": df.loc[trough_idx, "Date"],
-        "Peak_Price": df.loc[drawdown_start_idx, "Close"],
-        "Trough_Price": trough_price,
-        "Drawdown_Pct": dd_pct,
-        "Duration_Days": int((df.loc[trough_idx, "Date"] - df.loc[drawdown_start_idx, "Date"]).days),
-    }
+    return (
+        df.assign(
+            Drawdown=drawdown,
+            Running_Max=peaks,
+            Max_Drawdown=np.minimum.accumulate(drawdown),
+        ),
+        None,
+    )
 
 
 def find_major_drawdowns(df: pd.DataFrame, threshold: float = 20.0) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
@@ -158,6 +122,14 @@ def find_major_drawdowns(df: pd.DataFrame, threshold: float = 20.0) -> Tuple[Opt
         - Returns (None, message) if inputs invalid.
     - Side effects:
         - None.
+
+    Notes:
+        The episode scan runs in a Numba-compiled kernel
+        (risk._kernels._scan_drawdowns); this function only validates input
+        and assembles the result DataFrame. A drawdown episode starts at a
+        running-max peak, is tracked once price falls below 95% of that
+        peak, and ends when price makes a new high; episodes still open at
+        the end of the series are discarded.
     """
     if "Date" not in df.columns or "Close" not in df.columns:
         return None, "DataFrame must contain Date and Close columns."
@@ -168,30 +140,27 @@ def find_major_drawdowns(df: pd.DataFrame, threshold: float = 20.0) -> Tuple[Opt
     if df.empty:
         return pd.DataFrame(), None
 
-    records = []
-    current_peak_idx = 0
-    current_peak_price = df.loc[0, "Close"]
-    in_drawdown = False
-    drawdown_start_idx: Optional[int] = None
-
-    for i in range(1, len(df)):
-        price = df.loc[i, "Close"]
+    close = df["Close"].to_numpy(dtype=np.float64)
+    dates = df["Date"].to_numpy()
 
-        if price > current_peak_price:
-            if in_drawdown and drawdown_start_idx is not None:
-                metrics = _calculate_drawdown_metrics(df, drawdown_start_idx, i, threshold)
-                if metrics:
-                    records.append(metrics)
+    peak_idx, trough_idx, dd_pct = _scan_drawdowns(close, float(threshold))
 
-            in_drawdown = False
-            current_peak_idx = i
-            current_peak_price = price
-
-        elif not in_drawdown and price < current_peak_price * 0.95:
-            in_drawdown = True
-            drawdown_start_idx = current_peak_idx
+    if peak_idx.size == 0:
+        return pd.DataFrame(), None
 
-    return pd.DataFrame(records), None
+    drawdowns_df = pd.DataFrame(
+        {
+            "Peak_Date": dates[peak_idx],
+            "Trough_Date": dates[trough_idx],
+            "Peak_Price": close[peak_idx],
+            "Trough_Price": close[trough_idx],
+            "Drawdown_Pct": dd_pct,
+            "Duration_Days": (
+                (dates[trough_idx] - dates[peak_idx]) / np.timedelta64(1, "D")
+            ).astype(np.int64),
+        }
+    )
+    return drawdowns_df, None
 
 
 def calculate_recovery(df: pd.DataFrame, drawdowns_df: pd.DataFrame) -> pd.DataFrame:
@@ -208,37 +177,48 @@ def calculate_recovery(df: pd.DataFrame, drawdowns_df: pd.DataFrame) -> pd.DataF
         - Raises ValueError if required columns missing.
     - Side effects:
         - None.
+
+    Notes:
+        Vectorized: the running max of Close is non-decreasing, so the first
+        bar where price exceeds an episode's peak is one np.searchsorted call
+        per episode on the precomputed cummax array instead of a full
+        DataFrame scan per row. Episodes that never recover are dropped.
     """
     if drawdowns_df.empty:
         return drawdowns_df
 
-    records = []
-    for _, row in drawdowns_df.iterrows():
-        trough_date = row["Trough_Date"]
-        peak_price = row["Peak_Price"]
+    close = df["Close"].to_numpy(dtype=np.float64)
+    dates = df["Date"].to_numpy()
+    cummax = np.maximum.accumulate(close)
 
-        future = df[df["Date"] > trough_date]
-        recovery = future[future["Close"] >= peak_price]
+    peak_prices = drawdowns_df["Peak_Price"].to_numpy(dtype=np.float64)
+    trough_dates = drawdowns_df["Trough_Date"].to_numpy()
 
-        if recovery.empty:
-            continue
+    # First index where the running max exceeds the episode peak, i.e. the
+    # first close above the pre-drawdown high. searchsorted is valid because
+    # cummax is sorted, and broadcasts over all episodes at once.
+    recovery_idx = np.searchsorted(cummax, peak_prices, side="right")
+    recovered = recovery_idx < len(close)
 
-        recovery_date = recovery.iloc[0]["Date"]
-        recovery_days = int((recovery_date - trough_date).days)
-        recovery_months = round(recovery_days / 30.44, 1)
+    if not recovered.any():
+        return pd.DataFrame()
 
-        records.append(
-            {
-                "Drawdown_Pct": row["Drawdown_Pct"],
-                "Drawdown_Duration_Days": row["Duration_Days"],
-                "Recovery_Days": recovery_days,
-                "Recovery_Months": recovery_months,
-                "Trough_Date": trough_date,
-                "Recovery_Date": recovery_date,
-            }
-        )
+    recovery_idx = recovery_idx[recovered]
+    recovery_dates = dates[recovery_idx]
+    recovery_days = (
+        (recovery_dates - trough_dates[recovered]) / np.timedelta64(1, "D")
+    ).astype(np.int64)
 
-    return pd.DataFrame(records)
+    return pd.DataFrame(
+        {
+            "Drawdown_Pct": drawdowns_df["Drawdown_Pct"].to_numpy()[recovered],
+            "Drawdown_Duration_Days": drawdowns_df["Duration_Days"].to_numpy()[recovered],
+            "Recovery_Days": recovery_days,
+            "Recovery_Months": np.round(recovery_days / 30.44, 1),
+            "Trough_Date": trough_dates[recovered],
+            "Recovery_Date": recovery_dates,
+        }
+    )
 
 
 def calculate_risk_metrics(df: pd.DataFrame, ticker: str) -> Tuple[Optional[Dict[str, float]], Optional[str]]:
@@ -257,23 +237,45 @@ def calculate_risk_metrics(df: pd.DataFrame, ticker: str) -> Tuple[Optional[Dict
         - Returns (None, message) if required columns are missing.
     - Side effects:
         - None.
+
+    Notes:
+        All metrics are computed directly from the Close and Daily_Return
+        arrays — annualized mean/std for Sharpe, downside semi-deviation
+        for Sortino, and the running max for max drawdown — instead of
+        separate library calls that each re-walk the series. If the
+        DataFrame already carries Running_Max from the drawdown stage, it
+        is reused rather than recomputed.
     """
     if "Date" not in df.columns or "Close" not in df.columns or "Daily_Return" not in df.columns:
         return None, "DataFrame must contain Date, Close, and Daily_Return columns."
 
-    prices = pd.Series(df["Close"].values, index=df["Date"])
-    returns = pd.Series(df["Daily_Return"].values, index=df["Date"])
-
-    stats = ffn.calc_stats(prices)
-    total_return = stats.total_return
+    close = df["Close"].to_numpy(dtype=np.float64)
+    returns = df["Daily_Return"].to_numpy(dtype=np.float64)
+    returns = returns[~np.isnan(returns)]
 
-    cagr = qs.stats.cagr(returns)
-    vol = qs.stats.volatility(returns, periods=TRADING_DAYS_PER_YEAR)
-    sharpe = qs.stats.sharpe(returns, rf=RISK_FREE_RATE, periods=TRADING_DAYS_PER_YEAR)
-    sortino = qs.stats.sortino(returns, rf=RISK_FREE_RATE, periods=TRADING_DAYS_PER_YEAR)
-    max_dd = qs.stats.max_drawdown(returns)
+    if close.size < 2 or returns.size < 2:
+        return None, "Not enough data points to compute risk metrics."
 
     years = (df["Date"].iloc[-1] - df["Date"].iloc[0]).days / 365.25
+    total_return = close[-1] / close[0] - 1.0
+    cagr = (1.0 + total_return) ** (1.0 / years) - 1.0 if years > 0 else 0.0
+
+    mean = returns.mean()
+    std = returns.std(ddof=1)
+    downside = np.sqrt(np.mean(np.minimum(returns, 0.0) ** 2))
+    sqrt_periods = np.sqrt(TRADING_DAYS_PER_YEAR)
+
+    vol = std * sqrt_periods
+    annual_excess = mean * TRADING_DAYS_PER_YEAR - RISK_FREE_RATE
+    sharpe = annual_excess / (std * sqrt_periods) if std > 0 else 0.0
+    sortino = annual_excess / (downside * sqrt_periods) if downside > 0 else 0.0
+
+    if "Running_Max" in df.columns:
+        peaks = df["Running_Max"].to_numpy(dtype=np.float64)
+    else:
+        peaks = np.maximum.accumulate(close)
+    max_dd = float((close / peaks - 1.0).min())
+
     excess_return = cagr - RISK_FREE_RATE
 
     metrics = {
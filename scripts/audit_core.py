@@ -0,0 +1,525 @@
+"""
+Core implementation for the ASTRA code auditor.
+
+Split out of scripts/audit_code.py so the CLI stays a thin wrapper and
+this module can be compiled with Cython in pure-python mode for a faster
+visitor hot path. The `# cython` directive below and the PEP 484/526
+annotations throughout are consumed by Cython when a build is available;
+as plain CPython the module runs unchanged, so no build step is required.
+"""
+# cython: language_level=3
+
+import ast
+import functools
+import io
+import hashlib
+import os
+import pickle
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional
+from dataclasses import dataclass
+
+# Bump when the checks or AuditIssue format change so stale cache entries
+# are ignored automatically.
+CACHE_VERSION = "2"
+CACHE_DIR_NAME = ".astra_audit_cache"
+CACHE_MAX_ENTRIES = 4096
+
+# Paths matching any of these substrings are skipped by directory audits.
+# Compiled once into a single alternation so the per-file filter is one
+# regex scan instead of a Python loop over patterns.
+_EXCLUDE_PATTERNS = [
+    "test_",
+    "__pycache__",
+    ".pyc",
+    "scripts/audit_code.py",  # Don't audit the auditor
+    "scripts/audit_core.py",
+]
+_EXCLUDE_RE = re.compile("|".join(map(re.escape, _EXCLUDE_PATTERNS)))
+
+# Any of these in a docstring counts as a contract section; one compiled
+# alternation replaces four separate substring scans per docstring.
+_DOCSTRING_MARKERS = re.compile(r"Contract:|Args:|Parameters|Returns")
+
+# slots=True keeps instances tuple-sized (no per-instance __dict__) and
+# speeds field access; frozen=True because issues are never mutated after
+# construction.
+@dataclass(slots=True, frozen=True)
+class AuditIssue:
+    file: str
+    line: int
+    rule: str
+    severity: str  # "ERROR", "WARNING", "INFO"
+    message: str
+
+class _AuditVisitor(ast.NodeVisitor):
+    """Single-pass visitor running every function-level check.
+
+    Replaces six independent ast.walk traversals: each node is visited
+    once and dispatched to all applicable rules. A function stack lets
+    Global/ExceptHandler nodes be attributed to their enclosing function
+    without re-walking subtrees.
+    """
+
+    def __init__(self, file_str: str):
+        self.file = file_str
+        self.issues: List[AuditIssue] = []
+        # Stack of (name, is_public) for enclosing functions.
+        self._func_stack: List[tuple] = []
+        # Hot-path pre-binds: LOAD_FAST in _add instead of a
+        # LOAD_GLOBAL plus LOAD_ATTR per reported issue.
+        self._append = self.issues.append
+        self._issue = AuditIssue
+
+    def _add(self, line: int, rule: str, severity: str, message: str):
+        self._append(self._issue(
+            file=self.file,
+            line=line,
+            rule=rule,
+            severity=severity,
+            message=message
+        ))
+
+    def _enclosing_public_function(self) -> Optional[str]:
+        """Name of the nearest enclosing public function, if any."""
+        for name, is_public in reversed(self._func_stack):
+            if is_public:
+                return name
+        return None
+
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        # Name classified once per node (0=public, 1=private, 2=dunder);
+        # no rule body re-tests it.
+        name = node.name
+        kind = 2 if name.startswith('__') else (1 if name.startswith('_') else 0)
+
+        if kind == 1:
+            # Still descend for nested defs, but run no rule bodies.
+            self._func_stack.append((name, False))
+            self.generic_visit(node)
+            self._func_stack.pop()
+            return
+
+        self._check_type_hints(node)
+        self._check_docstring(node)
+        self._check_function_length(node)
+
+        self._func_stack.append((name, True))
+        self.generic_visit(node)
+        self._func_stack.pop()
+
+    def visit_Global(self, node: ast.Global):
+        # Check: No global state for function inputs (Rule #4, Forbidden Pattern #1).
+        func_name = self._enclosing_public_function()
+        if func_name is not None:
+            self._add(
+                node.lineno,
+                "GLOBAL_STATE",
+                "ERROR",
+                f"Function '{func_name}' uses 'global' statement (forbidden pattern)"
+            )
+        self.generic_visit(node)
+
+    def visit_ExceptHandler(self, node: ast.ExceptHandler):
+        # Check: Error handling patterns (Rule #8).
+        if node.type is None:  # bare except:
+            func_name = self._enclosing_public_function()
+            if func_name is not None:
+                self._add(
+                    node.lineno,
+                    "ERROR_HANDLING",
+                    "WARNING",
+                    f"Function '{func_name}' has bare 'except:' clause. Should specify exception type."
+                )
+        self.generic_visit(node)
+
+    def _check_type_hints(self, node: ast.FunctionDef):
+        """Check: All functions have type hints (Rule #11)."""
+        if node.returns is None:
+            self._add(
+                node.lineno,
+                "TYPE_HINTS",
+                "ERROR",
+                f"Function '{node.name}' missing return type hint"
+            )
+
+        for arg in node.args.args:
+            if arg.annotation is None and arg.arg != 'self':
+                self._add(
+                    node.lineno,
+                    "TYPE_HINTS",
+                    "ERROR",
+                    f"Function '{node.name}' parameter '{arg.arg}' missing type hint"
+                )
+
+    def _check_docstring(self, node: ast.FunctionDef):
+        """Check: All functions have docstrings (Rule #12)."""
+        docstring = ast.get_docstring(node)
+        if not docstring:
+            self._add(
+                node.lineno,
+                "DOCSTRINGS",
+                "ERROR",
+                f"Function '{node.name}' missing docstring"
+            )
+        elif _DOCSTRING_MARKERS.search(docstring) is None:
+            # Allow alternative docstring formats (Google/NumPy style)
+            self._add(
+                node.lineno,
+                "DOCSTRINGS",
+                "WARNING",
+                f"Function '{node.name}' docstring missing contract section (Contract:/Args:/Parameters:)"
+            )
+
+    def _check_function_length(self, node: ast.FunctionDef):
+        """Check: Functions < 50 lines (Rule #10)."""
+        start_line = node.lineno
+        end_line = node.end_lineno or start_line
+        length = end_line - start_line
+
+        if length > 50:
+            self._add(
+                node.lineno,
+                "FUNCTION_LENGTH",
+                "WARNING",
+                f"Function '{node.name}' is {length} lines (limit: 50). Consider breaking it down."
+            )
+
+def _iter_py_files(directory: Path):
+    """Yield .py files under directory via an os.scandir stack walk.
+
+    Unlike rglob, pruned directories (__pycache__) are never descended
+    into, and scandir reuses the directory entry's type information so
+    no extra stat call is made per path. Unreadable directories are
+    skipped.
+    """
+    stack = [str(directory)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name != "__pycache__":
+                            stack.append(entry.path)
+                    elif entry.name.endswith(".py"):
+                        yield Path(entry.path)
+        except OSError:
+            continue
+
+def _cache_path(cache_dir: Path, file_str: str, content: bytes) -> Path:
+    """Cache entry path for a file's current content."""
+    digest = hashlib.sha1(
+        file_str.encode('utf-8') + b'\x00' + content
+    ).hexdigest()
+    return cache_dir / f"{digest}-v{CACHE_VERSION}.pkl"
+
+def _cache_load(cache_path: Path) -> Optional[List[AuditIssue]]:
+    """Load cached issues, or None on miss/corruption."""
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+def _cache_store(cache_dir: Path, cache_path: Path, issues: List[AuditIssue]):
+    """Persist issues atomically (best effort; failures are ignored)."""
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(issues, f)
+        os.replace(tmp_path, cache_path)
+        _cache_evict(cache_dir)
+    except Exception:
+        pass
+
+def _cache_evict(cache_dir: Path):
+    """Drop oldest entries if the cache directory grows too large."""
+    entries = list(cache_dir.glob('*.pkl'))
+    if len(entries) <= CACHE_MAX_ENTRIES:
+        return
+    entries.sort(key=lambda p: p.stat().st_mtime)
+    for stale in entries[: len(entries) - CACHE_MAX_ENTRIES]:
+        try:
+            stale.unlink()
+        except OSError:
+            pass
+
+def audit_single_file(file_path: Path, cache_dir: Path) -> List[AuditIssue]:
+    """Audit a single Python file.
+
+    Module-level (not a method) so it is picklable and can run in worker
+    processes when auditing a directory in parallel.
+    """
+    issues = []
+    # One str() conversion per file; every issue and branch reuses it.
+    file_str = str(file_path)
+
+    try:
+        # Read raw bytes: ast.parse accepts bytes directly (and honors PEP
+        # 263 coding declarations), so the file is only decoded where text
+        # is actually needed.
+        with open(file_path, 'rb') as f:
+            content = f.read()
+        line_count = content.count(b'\n') + 1
+
+        # Unchanged files skip parsing and checking entirely.
+        cache_path = _cache_path(cache_dir, file_str, content)
+        cached = _cache_load(cache_path)
+        if cached is not None:
+            return cached
+
+        # Parse AST
+        try:
+            tree = ast.parse(content, filename=file_str)
+        except SyntaxError as e:
+            issues.append(AuditIssue(
+                file=file_str,
+                line=e.lineno or 0,
+                rule="SYNTAX_ERROR",
+                severity="ERROR",
+                message=f"Syntax error: {e.msg}"
+            ))
+            _cache_store(cache_dir, cache_path, issues)
+            return issues
+
+        # Import-only modules (thin __init__.py files, config modules)
+        # give the function-level rules nothing to do; a cheap generator
+        # scan skips the visitor dispatch pass entirely for them.
+        if any(isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef)) for n in ast.walk(tree)):
+            # Run all AST-level checks in a single traversal.
+            visitor = _AuditVisitor(file_str)
+            visitor.visit(tree)
+            issues.extend(visitor.issues)
+        issues.extend(_check_module_structure(file_str, tree, line_count))
+
+        _cache_store(cache_dir, cache_path, issues)
+
+    except Exception as e:
+        issues.append(AuditIssue(
+            file=file_str,
+            line=0,
+            rule="AUDIT_ERROR",
+            severity="ERROR",
+            message=f"Failed to audit file: {str(e)}"
+        ))
+
+    return issues
+
+def _check_module_structure(file_str: str, tree: ast.Module, line_count: int) -> List[AuditIssue]:
+    """Check: Module structure compliance (Rule #1)."""
+    issues = []
+
+    # Check if ASTRA.py has business logic (should only have UI wiring)
+    if os.path.basename(file_str) == "ASTRA.py":
+        # Inspect function definitions in the already-parsed AST instead of
+        # running a regex over every source line: no false hits in strings
+        # or comments, and no re-scan of the file. Walk the whole tree so
+        # calculate_* methods and nested defs are caught, matching the
+        # line-based scan's coverage.
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name.startswith("calculate_"):
+                issues.append(AuditIssue(
+                    file=file_str,
+                    line=node.lineno,
+                    rule="MODULE_STRUCTURE",
+                    severity="ERROR",
+                    message="ASTRA.py should only contain UI wiring, not business logic (found calculate_* function)"
+                ))
+
+    # Check module size (Rule #10)
+    if line_count > 1000:
+        issues.append(AuditIssue(
+            file=file_str,
+            line=1,
+            rule="MODULE_SIZE",
+            severity="ERROR",
+            message=f"File is {line_count} lines (limit: 1000). Refactor immediately."
+        ))
+    elif line_count > 500:
+        issues.append(AuditIssue(
+            file=file_str,
+            line=1,
+            rule="MODULE_SIZE",
+            severity="WARNING",
+            message=f"File is {line_count} lines (limit: 500). Consider splitting."
+        ))
+
+    return issues
+
+class CodeAuditor:
+    def __init__(self, root_dir: Path):
+        self.root_dir = root_dir
+        self.issues: List[AuditIssue] = []
+        self.cache_dir = root_dir / CACHE_DIR_NAME
+
+    def audit_file(self, file_path: Path) -> List[AuditIssue]:
+        """Audit a single Python file."""
+        return audit_single_file(file_path, self.cache_dir)
+
+    def _audit_iter(self, directory: Path):
+        """Yield each file's issue list for all Python files in directory.
+
+        Files are independent, so for larger trees they are audited in a
+        process pool; small trees stay serial to skip pool startup cost.
+        Results arrive one file at a time either way, so callers can
+        stream them without holding every issue in memory.
+        """
+        exclude = _EXCLUDE_RE.search
+        py_files = [
+            py_file
+            for py_file in _iter_py_files(directory)
+            if not exclude(str(py_file))
+        ]
+
+        if len(py_files) < 16:
+            for py_file in py_files:
+                yield self.audit_file(py_file)
+            return
+
+        worker = functools.partial(audit_single_file, cache_dir=self.cache_dir)
+        chunksize = max(1, len(py_files) // ((os.cpu_count() or 1) * 4))
+        with ProcessPoolExecutor() as executor:
+            yield from executor.map(worker, py_files, chunksize=chunksize)
+
+    def audit_directory(self, directory: Path) -> List[AuditIssue]:
+        """Audit all Python files in directory."""
+        all_issues = []
+        for issues in self._audit_iter(directory):
+            all_issues.extend(issues)
+        return all_issues
+
+    def audit_directory_streaming(self, directory: Path, writer=None) -> int:
+        """Audit directory, writing each file's issues as they arrive.
+
+        Peak memory stays at O(issues per file) instead of O(total
+        issues): issues are written immediately and only per-severity
+        counters are kept for the summary block. Returns the error
+        count so the CLI can set its exit code.
+        """
+        if writer is None:
+            writer = sys.stdout.write
+        counts = {"ERROR": 0, "WARNING": 0, "INFO": 0}
+
+        writer(f"\n📊 ASTRA Code Audit Report\n{'='*70}\n")
+        for issues in self._audit_iter(directory):
+            if not issues:
+                continue
+            buf = io.StringIO()
+            w = buf.write
+            for issue in issues:
+                counts[issue.severity] += 1
+                w(f"  [{issue.severity}] {issue.file}:{issue.line}\n")
+                w(f"    Rule: {issue.rule}\n")
+                w(f"    {issue.message}\n\n")
+            writer(buf.getvalue())
+
+        errors = counts["ERROR"]
+        warnings = counts["WARNING"]
+        writer(f"{'='*70}\n")
+        writer(f"Total Issues: {errors + warnings + counts['INFO']}\n")
+        writer(f"  ❌ Errors: {errors} (Must Fix)\n")
+        writer(f"  ⚠️  Warnings: {warnings} (Should Fix)\n")
+        writer(f"  ℹ️  Info: {counts['INFO']}\n")
+        if errors:
+            writer(f"❌ Audit FAILED: {errors} error(s) must be fixed.\n")
+        elif warnings:
+            writer(f"⚠️  Audit PASSED with {warnings} warning(s) to review.\n")
+        else:
+            writer(f"✅ Audit PASSED: All checks passed.\n")
+        writer(f"{'='*70}\n\n")
+        return errors
+
+    def watch(self, directory: Path, interval: float = 1.0):
+        """Re-audit directory whenever a source file changes.
+
+        Poll-based dev loop: each tick compares file mtimes against the
+        previous pass and re-runs the audit when anything changed. The
+        content-hash cache makes unchanged files nearly free, so each
+        re-audit only pays for the edited files. Runs until interrupted
+        (Ctrl-C).
+        """
+        exclude = _EXCLUDE_RE.search
+        last_state = None
+        while True:
+            state = {}
+            for py_file in _iter_py_files(directory):
+                path_str = str(py_file)
+                if exclude(path_str):
+                    continue
+                try:
+                    state[path_str] = os.stat(path_str).st_mtime_ns
+                except OSError:
+                    continue
+            if state != last_state:
+                last_state = state
+                issues = self.audit_directory(directory)
+                try:
+                    self.print_report(issues)
+                except SystemExit:
+                    # print_report exits on errors for CI use; in watch
+                    # mode keep running so fixes are picked up live.
+                    pass
+            time.sleep(interval)
+
+    def print_report(self, issues: List[AuditIssue]):
+        """Print audit report."""
+        if not issues:
+            print("✅ No issues found. Code complies with standards.")
+            return
+
+        # Group by severity in one pass instead of three comprehensions.
+        buckets = {"ERROR": [], "WARNING": [], "INFO": []}
+        for issue in issues:
+            buckets[issue.severity].append(issue)
+        errors = buckets["ERROR"]
+        warnings = buckets["WARNING"]
+        info = buckets["INFO"]
+
+        # Assemble the whole report in a buffer and write it once: one
+        # stdout write instead of four print calls per issue.
+        buf = io.StringIO()
+        w = buf.write
+
+        w(f"\n📊 ASTRA Code Audit Report\n")
+        w(f"{'='*70}\n")
+        w(f"Total Issues: {len(issues)}\n")
+        w(f"  ❌ Errors: {len(errors)} (Must Fix)\n")
+        w(f"  ⚠️  Warnings: {len(warnings)} (Should Fix)\n")
+        w(f"  ℹ️  Info: {len(info)}\n")
+        w(f"{'='*70}\n\n")
+
+        for heading, bucket in (
+            ("❌ ERRORS (Must Fix):", errors),
+            ("⚠️  WARNINGS (Should Fix):", warnings),
+            ("ℹ️  INFO:", info),
+        ):
+            if not bucket:
+                continue
+            w(f"{heading}\n")
+            w(f"{'-'*70}\n")
+            for issue in bucket:
+                w(f"  {issue.file}:{issue.line}\n")
+                w(f"    Rule: {issue.rule}\n")
+                w(f"    {issue.message}\n\n")
+
+        # Summary
+        w(f"{'='*70}\n")
+        if errors:
+            w(f"❌ Audit FAILED: {len(errors)} error(s) must be fixed.\n")
+        elif warnings:
+            w(f"⚠️  Audit PASSED with {len(warnings)} warning(s) to review.\n")
+        else:
+            w(f"✅ Audit PASSED: All checks passed.\n")
+        w(f"{'='*70}\n\n")
+
+        sys.stdout.write(buf.getvalue())
+
+        # Exit with error code if errors found
+        if errors:
+            sys.exit(1)
@@ -2,6 +2,111 @@
 Tests for risk/metrics.py
 """
 
-# Placeholder for metrics tests
-# Add smoke tests for calculate_returns, calculate_volatility, etc.
+import numpy as np
+import pandas as pd
 
+from risk.metrics import (
+    calculate_recovery,
+    calculate_returns,
+    calculate_volatility,
+    find_major_drawdowns,
+)
+
+
+def _make_price_df(close: np.ndarray) -> pd.DataFrame:
+    """Build a minimal price DataFrame for the given Close series."""
+    dates = pd.date_range("2020-01-01", periods=len(close), freq="B")
+    return pd.DataFrame({"Date": dates, "Close": close})
+
+
+def test_calculate_returns_smoke() -> None:
+    """
+    Smoke test: calculate_returns adds Daily_Return matching pct_change.
+    """
+    df = _make_price_df(np.array([100.0, 110.0, 99.0, 99.0]))
+    result, err = calculate_returns(df)
+    assert err is None
+    expected = df["Close"].pct_change().to_numpy()
+    assert np.allclose(result["Daily_Return"].to_numpy(), expected, equal_nan=True)
+
+
+def test_calculate_volatility_smoke() -> None:
+    """
+    Smoke test: volatility columns match pandas rolling std, annualized.
+    """
+    rng = np.random.default_rng(0)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, 400)))
+    df, err = calculate_returns(_make_price_df(close))
+    assert err is None
+    result, err = calculate_volatility(df)
+    assert err is None
+    expected = (df["Daily_Return"].rolling(30).std() * np.sqrt(252) * 100.0).to_numpy()
+    assert np.allclose(result["Volatility_30d"].to_numpy(), expected, equal_nan=True)
+
+
+def test_find_major_drawdowns_detects_known_episode() -> None:
+    """
+    A 30% drop followed by a recovery above the old peak is one episode.
+    """
+    close = np.concatenate(
+        [
+            np.linspace(100.0, 120.0, 20),  # rally to peak
+            np.linspace(118.0, 84.0, 30),  # -30% drawdown
+            np.linspace(85.0, 130.0, 30),  # recovery to new high
+        ]
+    )
+    drawdowns, err = find_major_drawdowns(_make_price_df(close), threshold=20.0)
+    assert err is None
+    assert len(drawdowns) == 1
+    row = drawdowns.iloc[0]
+    assert np.isclose(row["Peak_Price"], 120.0)
+    assert np.isclose(row["Trough_Price"], 84.0)
+    assert row["Drawdown_Pct"] < -20.0
+
+
+def test_find_major_drawdowns_ignores_open_episode() -> None:
+    """
+    A drawdown still open at the end of the series is not reported.
+    """
+    close = np.concatenate([np.linspace(100.0, 120.0, 20), np.linspace(118.0, 60.0, 30)])
+    drawdowns, err = find_major_drawdowns(_make_price_df(close), threshold=20.0)
+    assert err is None
+    assert drawdowns.empty
+
+
+def test_calculate_recovery_columns() -> None:
+    """
+    Recovery output is built columnar with the documented schema.
+    """
+    close = np.concatenate(
+        [
+            np.linspace(100.0, 120.0, 20),
+            np.linspace(118.0, 84.0, 30),
+            np.linspace(85.0, 130.0, 30),
+        ]
+    )
+    df = _make_price_df(close)
+    drawdowns, err = find_major_drawdowns(df, threshold=20.0)
+    assert err is None and len(drawdowns) == 1
+    recovery = calculate_recovery(df, drawdowns)
+    assert list(recovery.columns) == [
+        "Drawdown_Pct",
+        "Drawdown_Duration_Days",
+        "Recovery_Days",
+        "Recovery_Months",
+        "Trough_Date",
+        "Recovery_Date",
+    ]
+    assert len(recovery) == 1
+    assert recovery["Recovery_Days"].iloc[0] > 0
+
+
+def test_find_major_drawdowns_rejects_bad_input() -> None:
+    """
+    Missing columns or a non-positive threshold return an error message.
+    """
+    df = _make_price_df(np.array([100.0, 90.0]))
+    result, err = find_major_drawdowns(df.drop(columns=["Close"]))
+    assert result is None and err is not None
+    result, err = find_major_drawdowns(df, threshold=0.0)
+    assert result is None and err is not None